@@ -1,21 +1,255 @@
 import dataclasses
 import datetime
 import decimal
+import functools
 import typing
 import uuid
 
 import pydantic
 import pytest
+from faker import Faker
 
 from dataclasses_avroschema import AvroModel, types
 from dataclasses_avroschema.avrodantic import AvroBaseModel
+from dataclasses_avroschema.faker import fake
 
 from .const import pydantic_fields
 
-parametrize_base_model = pytest.mark.parametrize(
-    "model_class, decorator", [(AvroModel, dataclasses.dataclass), (AvroBaseModel, lambda f: f)]
+base_model_variants = (
+    (AvroModel, dataclasses.dataclass),
+    (AvroBaseModel, lambda f: f),
 )
 
+parametrize_base_model = pytest.mark.parametrize("model_class", [AvroModel, AvroBaseModel])
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_faker() -> Faker:
+    """
+    Seed the library's shared Faker instance so every `.fake()` call in this
+    module reuses the same providers and generates deterministic data.
+    """
+    fake.seed_instance(0)
+    return fake
+
+
+def build_per_base_model(builder: typing.Callable) -> typing.Dict[typing.Type[AvroModel], typing.Type[AvroModel]]:
+    """
+    Build the model returned by `builder` once per base-model variant so the
+    parametrized tests reuse the class objects instead of recreating them
+    on every invocation.
+    """
+    return {model_class: builder(model_class, decorator) for model_class, decorator in base_model_variants}
+
+
+@functools.lru_cache(maxsize=None)
+def get_avro_schema(model_class: typing.Type[AvroModel]) -> str:
+    return model_class.avro_schema()
+
+
+@pytest.fixture(scope="module")
+def logical_types_model() -> typing.Dict[typing.Type[AvroModel], typing.Type[AvroModel]]:
+    def build(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> typing.Type[AvroModel]:
+        @decorator
+        class LogicalTypes(model_class):
+            birthday: datetime.date
+            meeting_time: datetime.time
+            meeting_time_micro: types.TimeMicro
+            release_datetime: datetime.datetime
+            release_datetime_micro: types.DateTimeMicro
+            event_uuid: uuid.UUID
+
+        return LogicalTypes
+
+    return build_per_base_model(build)
+
+
+@pytest.fixture(scope="module")
+def union_model() -> typing.Dict[typing.Type[AvroModel], typing.Type[AvroModel]]:
+    def build(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> typing.Type[AvroModel]:
+        if model_class is AvroBaseModel:
+            field = pydantic.Field
+        else:
+            field = dataclasses.field
+
+        @decorator
+        class Bus(model_class):
+            engine_name: str
+
+            class Meta:
+                namespace = "types.bus_type"
+
+        @decorator
+        class Car(model_class):
+            engine_name: str
+
+            class Meta:
+                namespace = "types.car_type"
+
+        @decorator
+        class UnionSchema(model_class):
+            first_union: typing.Union[str, int]
+            logical_union: typing.Union[datetime.datetime, datetime.date, uuid.UUID]
+            lake_trip: typing.Union[Bus, Car]
+            river_trip: typing.Optional[typing.Union[Bus, Car]] = None
+            mountain_trip: typing.Union[Bus, Car] = field(default_factory=lambda: Bus(engine_name="honda"))
+
+        return UnionSchema
+
+    return build_per_base_model(build)
+
+
+@pytest.fixture(scope="module")
+def one_to_one_model() -> typing.Dict[typing.Type[AvroModel], typing.Type[AvroModel]]:
+    def build(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> typing.Type[AvroModel]:
+        @decorator
+        class Address(model_class):
+            street: str
+            street_number: int
+
+        @decorator
+        class User(model_class):
+            name: str
+            age: int
+            address: Address
+
+        return User
+
+    return build_per_base_model(build)
+
+
+@pytest.fixture(scope="module")
+def one_to_many_model() -> typing.Dict[typing.Type[AvroModel], typing.Type[AvroModel]]:
+    def build(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> typing.Type[AvroModel]:
+        @decorator
+        class Address(model_class):
+            street: str
+            street_number: int
+
+        @decorator
+        class User(model_class):
+            name: str
+            age: int
+            addresses: typing.List[Address]
+
+        return User
+
+    return build_per_base_model(build)
+
+
+@pytest.fixture(scope="module")
+def one_to_many_tuples_model() -> typing.Dict[typing.Type[AvroModel], typing.Type[AvroModel]]:
+    def build(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> typing.Type[AvroModel]:
+        @decorator
+        class Address(model_class):
+            street: str
+            street_number: int
+
+        @decorator
+        class User(model_class):
+            addresses: typing.Tuple[Address, ...]
+
+        return User
+
+    return build_per_base_model(build)
+
+
+@pytest.fixture(scope="module")
+def one_to_many_map_model() -> typing.Dict[typing.Type[AvroModel], typing.Type[AvroModel]]:
+    def build(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> typing.Type[AvroModel]:
+        @decorator
+        class Address(model_class):
+            street: str
+            street_number: int
+
+        @decorator
+        class User(model_class):
+            name: str
+            age: int
+            addresses: typing.Dict[str, Address]
+
+        return User
+
+    return build_per_base_model(build)
+
+
+@pytest.fixture(scope="module")
+def self_one_to_one_model() -> typing.Dict[typing.Type[AvroModel], typing.Type[AvroModel]]:
+    def build(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> typing.Type[AvroModel]:
+        @decorator
+        class User(model_class):
+            name: str
+            age: int
+            teamates: typing.Optional[typing.Type["User"]] = None
+
+        return User
+
+    return build_per_base_model(build)
+
+
+@pytest.fixture(scope="module")
+def optional_relationship_model() -> typing.Dict[typing.Type[AvroModel], typing.Type[AvroModel]]:
+    def build(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> typing.Type[AvroModel]:
+        @decorator
+        class Address(model_class):
+            street: str
+            street_number: int
+
+        @decorator
+        class User(model_class):
+            name: str
+            age: int
+            address: typing.Optional[Address] = None
+
+        return User
+
+    return build_per_base_model(build)
+
+
+@pytest.fixture(scope="module")
+def decimals_model() -> typing.Dict[typing.Type[AvroModel], typing.Type[AvroModel]]:
+    def build(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> typing.Type[AvroModel]:
+        @decorator
+        class User(model_class):
+            name: str
+            age: int
+            test_score_1: types.condecimal(max_digits=11, decimal_places=5)
+            test_score_2: types.condecimal(max_digits=5, decimal_places=2) = decimal.Decimal("100.00")
+
+        return User
+
+    return build_per_base_model(build)
+
+
+@pytest.fixture(scope="module")
+def int32_model() -> typing.Dict[typing.Type[AvroModel], typing.Type[AvroModel]]:
+    def build(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> typing.Type[AvroModel]:
+        @decorator
+        class User(model_class):
+            name: str
+            age: int
+            test_score_1: types.Int32 = 100
+            test_score_2: types.Int32 = types.Int32(12)
+
+        return User
+
+    return build_per_base_model(build)
+
+
+@pytest.fixture(scope="module")
+def float32_model() -> typing.Dict[typing.Type[AvroModel], typing.Type[AvroModel]]:
+    def build(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> typing.Type[AvroModel]:
+        @decorator
+        class User(model_class):
+            name: str
+            age: int
+            test_score_1: types.Float32 = 100.0
+            test_score_2: types.Float32 = types.Float32(12.4)
+
+        return User
+
+    return build_per_base_model(build)
+
 
 def test_fake_primitive_types(user_dataclass: typing.Type) -> None:
     assert isinstance(user_dataclass.fake(), user_dataclass)
@@ -57,147 +291,69 @@ def test_fake_with_user_data(user_advance_dataclass: typing.Type) -> None:
 
 
 @parametrize_base_model
-def test_fake_with_logical_types(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
-    @decorator
-    class LogicalTypes(model_class):
-        birthday: datetime.date
-        meeting_time: datetime.time
-        meeting_time_micro: types.TimeMicro
-        release_datetime: datetime.datetime
-        release_datetime_micro: types.DateTimeMicro
-        event_uuid: uuid.UUID
-
-    assert isinstance(LogicalTypes.fake(), LogicalTypes)
+def test_fake_with_logical_types(model_class: typing.Type[AvroModel], logical_types_model: typing.Dict) -> None:
+    logical_types = logical_types_model[model_class]
+    assert isinstance(logical_types.fake(), logical_types)
 
 
 @parametrize_base_model
-def test_fake_union(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
-    if model_class is AvroBaseModel:
-        field = pydantic.Field
-    else:
-        field = dataclasses.field
-
-    @decorator
-    class Bus(model_class):
-        engine_name: str
-
-        class Meta:
-            namespace = "types.bus_type"
-
-    @decorator
-    class Car(model_class):
-        engine_name: str
-
-        class Meta:
-            namespace = "types.car_type"
-
-    @decorator
-    class UnionSchema(model_class):
-        first_union: typing.Union[str, int]
-        logical_union: typing.Union[datetime.datetime, datetime.date, uuid.UUID]
-        lake_trip: typing.Union[Bus, Car]
-        river_trip: typing.Optional[typing.Union[Bus, Car]] = None
-        mountain_trip: typing.Union[Bus, Car] = field(default_factory=lambda: Bus(engine_name="honda"))
-
-    assert isinstance(UnionSchema.fake(), UnionSchema)
+def test_fake_union(model_class: typing.Type[AvroModel], union_model: typing.Dict) -> None:
+    union_schema = union_model[model_class]
+    assert isinstance(union_schema.fake(), union_schema)
 
 
 @parametrize_base_model
-def test_fake_one_to_one_relationship(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
+def test_fake_one_to_one_relationship(model_class: typing.Type[AvroModel], one_to_one_model: typing.Dict) -> None:
     """
     Test schema relationship one-to-one
     """
-
-    @decorator
-    class Address(model_class):
-        street: str
-        street_number: int
-
-    @decorator
-    class User(model_class):
-        name: str
-        age: int
-        address: Address
-
-    assert isinstance(User.fake(), User)
+    user = one_to_one_model[model_class]
+    assert isinstance(user.fake(), user)
 
 
 @parametrize_base_model
-def test_fake_one_to_many_relationship(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
+def test_fake_one_to_many_relationship(model_class: typing.Type[AvroModel], one_to_many_model: typing.Dict) -> None:
     """
     Test schema relationship one-to-many
     """
-
-    @decorator
-    class Address(model_class):
-        street: str
-        street_number: int
-
-    @decorator
-    class User(model_class):
-        name: str
-        age: int
-        addresses: typing.List[Address]
-
-    user = User.fake()
-    assert isinstance(user, User)
-    assert User.avro_schema()
+    user_class = one_to_many_model[model_class]
+    user = user_class.fake()
+    assert isinstance(user, user_class)
+    assert get_avro_schema(user_class)
 
 
 @parametrize_base_model
-def test_fake_one_to_many_with_tuples(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
+def test_fake_one_to_many_with_tuples(
+    model_class: typing.Type[AvroModel], one_to_many_tuples_model: typing.Dict
+) -> None:
     """
     Test schema relationship one-to-many
     """
-
-    @decorator
-    class Address(model_class):
-        street: str
-        street_number: int
-
-    @decorator
-    class User(model_class):
-        addresses: typing.Tuple[Address, ...]
-
-    user = User.fake()
-    assert isinstance(user, User)
-    assert User.avro_schema()
+    user_class = one_to_many_tuples_model[model_class]
+    user = user_class.fake()
+    assert isinstance(user, user_class)
+    assert get_avro_schema(user_class)
     assert isinstance(user.addresses, tuple)
 
 
 @parametrize_base_model
-def test_fake_one_to_many_map_relationship(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
+def test_fake_one_to_many_map_relationship(
+    model_class: typing.Type[AvroModel], one_to_many_map_model: typing.Dict
+) -> None:
     """
     Test schema relationship one-to-many using a map
     """
-
-    @decorator
-    class Address(model_class):
-        street: str
-        street_number: int
-
-    @decorator
-    class User(model_class):
-        name: str
-        age: int
-        addresses: typing.Dict[str, Address]
-
-    assert isinstance(User.fake(), User)
+    user = one_to_many_map_model[model_class]
+    assert isinstance(user.fake(), user)
 
 
 @parametrize_base_model
-def test_self_one_to_one_relationship(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
+def test_self_one_to_one_relationship(model_class: typing.Type[AvroModel], self_one_to_one_model: typing.Dict) -> None:
     """
     Test self relationship one-to-one
     """
-
-    @decorator
-    class User(model_class):
-        name: str
-        age: int
-        teamates: typing.Optional[typing.Type["User"]] = None
-
-    assert isinstance(User.fake(), User)
+    user = self_one_to_one_model[model_class]
+    assert isinstance(user.fake(), user)
 
 
 # TODO: add pydantic test
@@ -233,72 +389,40 @@ def test_self_one_to_many_map_relationship() -> None:
 
 
 @parametrize_base_model
-def test_optional_relationship(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
-    @decorator
-    class Address(model_class):
-        street: str
-        street_number: int
-
-    @decorator
-    class User(model_class):
-        name: str
-        age: int
-        address: typing.Optional[Address] = None
-
-    assert isinstance(User.fake(), User)
+def test_optional_relationship(model_class: typing.Type[AvroModel], optional_relationship_model: typing.Dict) -> None:
+    user = optional_relationship_model[model_class]
+    assert isinstance(user.fake(), user)
 
 
 @parametrize_base_model
-def test_decimals(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
+def test_decimals(model_class: typing.Type[AvroModel], decimals_model: typing.Dict) -> None:
     """
     Test Decimal logical types
     """
-
-    @decorator
-    class User(model_class):
-        name: str
-        age: int
-        test_score_1: types.condecimal(max_digits=11, decimal_places=5)
-        test_score_2: types.condecimal(max_digits=5, decimal_places=2) = decimal.Decimal("100.00")
-
-    assert isinstance(User.fake(), User)
+    user = decimals_model[model_class]
+    assert isinstance(user.fake(), user)
 
 
 @parametrize_base_model
-def test_int32(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
+def test_int32(model_class: typing.Type[AvroModel], int32_model: typing.Dict) -> None:
     """
     Test Int32 type
     """
-
-    @decorator
-    class User(model_class):
-        name: str
-        age: int
-        test_score_1: types.Int32 = 100
-        test_score_2: types.Int32 = types.Int32(12)
-
-    assert isinstance(User.fake(), User)
+    user = int32_model[model_class]
+    assert isinstance(user.fake(), user)
 
 
 @parametrize_base_model
-def test_float32(model_class: typing.Type[AvroModel], decorator: typing.Callable) -> None:
+def test_float32(model_class: typing.Type[AvroModel], float32_model: typing.Dict) -> None:
     """
     Test Float32 type
     """
-
-    @decorator
-    class User(model_class):
-        name: str
-        age: int
-        test_score_1: types.Float32 = 100.0
-        test_score_2: types.Float32 = types.Float32(12.4)
-
-    assert isinstance(User.fake(), User)
+    user = float32_model[model_class]
+    assert isinstance(user.fake(), user)
 
 
-@pytest.mark.parametrize("pydantic_field", pydantic_fields)
-def test_pydantic_field(pydantic_field) -> None:
-    class User(AvroBaseModel):
-        name: pydantic_field
+def test_pydantic_fields() -> None:
+    annotations = {f"field_{index}": pydantic_field for index, pydantic_field in enumerate(pydantic_fields)}
+    User = type("User", (AvroBaseModel,), {"__annotations__": annotations})
 
     assert isinstance(User.fake(), User)